@@ -0,0 +1,12 @@
+# Shared by the compiled kernel modules (engines/_*_kernels.py).
+#
+# Every @njit kernel in them carries an explicit signature, so it is compiled
+# eagerly (or loaded from the on-disk cache) when its module is imported
+# instead of on the first forward() call. The engines import a kernel module
+# only for the backend they are configured with, so unused backends are never
+# compiled. The signatures pin every array to C-contiguous rows (f4[:, ::1]),
+# so LLVM can assume unit stride and never has to emit dynamic-stride indexing.
+import numpy as np
+
+# float32 zero for branchless ReLU (max(v, ZERO) stays in float32 lanes)
+ZERO = np.float32(0.0)
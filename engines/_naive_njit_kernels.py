@@ -0,0 +1,21 @@
+# Compiled kernel behind NaiveNjitExecutionEngine (signature-bound, see
+# _kernel_common.py). The engine imports it on construction, so merely
+# importing engines.naive_njit stays cheap.
+import numpy as np
+from numba import njit, prange
+
+
+@njit('f4[:, ::1](f4[:, ::1], f4[:, ::1], f4[::1], f4[:, ::1], f4[::1])', parallel=True, cache=True)
+def naive_forward_rows(x, W1, b1, W2, b2):
+    """
+    The naive forward, one sample per prange iteration.
+
+    Every op inside the loop still allocates a fresh array (matmul result,
+    bias add, ReLU, second matmul, bias add), exactly like the NumPy
+    baseline; only the batch is split across threads.
+    """
+    y = np.empty((x.shape[0], W2.shape[1]), dtype=np.float32)
+    for i in prange(x.shape[0]):
+        hidden = np.maximum(x[i] @ W1 + b1, np.float32(0.0))
+        y[i] = hidden @ W2 + b2
+    return y
@@ -0,0 +1,130 @@
+# Compiled kernels behind OptimizedExecutionEngine's fp32 'tiled' backend.
+import numpy as np
+from numba import njit, prange
+from ._kernel_common import ZERO
+
+# Cache-blocking parameters:
+# MC rows of A per parallel tile, NC columns of B per packed panel, KC of the
+# shared dimension per panel (KC x NC fp32 = 256 KB, sized for L2), and MR rows
+# per register micro-tile.
+MC, NC, KC, MR = 64, 256, 256, 4
+
+
+@njit('void(f4[:, ::1], f4[:, ::1], f4[:, ::1], i8, i8, i8, i8, i8)', fastmath=True, cache=True)
+def micro_kernel(A, Bp, C, i, pc, kc, jc, nc):
+    """
+    C[i:i+MR, jc:jc+nc] += A[i:i+MR, pc:pc+kc] @ Bp[:kc, :nc]
+
+    Each packed row of B is loaded once and reused for MR rows of C; the
+    inner j loop is unit-stride on both Bp and C, so LLVM vectorizes it.
+    """
+    c0 = C[i, jc:jc + nc]
+    c1 = C[i + 1, jc:jc + nc]
+    c2 = C[i + 2, jc:jc + nc]
+    c3 = C[i + 3, jc:jc + nc]
+    for p in range(kc):
+        a0 = A[i, pc + p]
+        a1 = A[i + 1, pc + p]
+        a2 = A[i + 2, pc + p]
+        a3 = A[i + 3, pc + p]
+        b_row = Bp[p]
+        for j in range(nc):
+            b = b_row[j]
+            c0[j] += a0 * b
+            c1[j] += a1 * b
+            c2[j] += a2 * b
+            c3[j] += a3 * b
+
+
+def pack_b(B):
+    """
+    Pack B (K, N) once into the tiled GEMM's panel layout.
+
+    Returns Bp of shape (N/NC, K/KC, KC, NC) (rounded up, zero-padded):
+    Bp[jb, pb] is the contiguous KC x NC panel the micro-kernel streams. The
+    weights are read-only, so this replaces per-call packing inside the GEMM.
+    """
+    K, N = B.shape
+    n_pc = (K + KC - 1) // KC
+    n_jc = (N + NC - 1) // NC
+    Bp = np.zeros((n_jc, n_pc, KC, NC), dtype=np.float32)
+    for jb in range(n_jc):
+        jc = jb * NC
+        for pb in range(n_pc):
+            pc = pb * KC
+            panel = B[pc:pc + KC, jc:jc + NC]
+            Bp[jb, pb, :panel.shape[0], :panel.shape[1]] = panel
+    return Bp
+
+
+@njit('void(f4[:, ::1], f4[:, :, :, ::1], f4[::1], f4[:, ::1], b1)', parallel=True, fastmath=True, cache=True)
+def gemm_tiled(A, Bp, bias, C, relu):
+    """
+    C = A @ B + bias (optionally followed by ReLU), cache-blocked.
+
+    Bp is B pre-packed by pack_b. The parallel loop runs over every
+    (NC column panel, MC row block) tile of C, so even a batch smaller than
+    MC is split across threads by column panel. Within a tile: KC panels of
+    the shared dimension, each reused by the whole row block -> MR-row
+    micro-kernel. Tiles are disjoint, so the bias/ReLU epilogue runs on each
+    one as soon as it is complete, while it is still cache-resident.
+    """
+    M, K = A.shape
+    N = C.shape[1]
+    n_mb = (M + MC - 1) // MC
+
+    for t in prange(Bp.shape[0] * n_mb):
+        jb = t // n_mb
+        mb = t - jb * n_mb
+        jc = jb * NC
+        nc = min(NC, N - jc)
+        i0 = mb * MC
+        i_end = min(i0 + MC, M)
+
+        for r in range(i0, i_end):
+            C[r, jc:jc + nc] = 0.0
+
+        for pb in range(Bp.shape[1]):
+            pc = pb * KC
+            kc = min(KC, K - pc)
+            panel = Bp[jb, pb]
+
+            i = i0
+            while i + MR <= i_end:
+                micro_kernel(A, panel, C, i, pc, kc, jc, nc)
+                i += MR
+
+            # Remainder rows (M not a multiple of MR)
+            for r in range(i, i_end):
+                c_row = C[r, jc:jc + nc]
+                for p in range(kc):
+                    a = A[r, pc + p]
+                    b_row = panel[p]
+                    for j in range(nc):
+                        c_row[j] += a * b_row[j]
+
+        # Epilogue on the finished tile
+        for r in range(i0, i_end):
+            for j in range(jc, jc + nc):
+                v = C[r, j] + bias[j]
+                if relu:
+                    v = max(v, ZERO)
+                C[r, j] = v
+
+
+@njit('void(f4[:, ::1], f4[:, :, :, ::1], f4[::1], f4[:, ::1])', cache=True)
+def gemm_relu_bias_tiled(A, Bp, bias, C):
+    """C = relu(A @ B + bias) via the tiled GEMM on pre-packed B."""
+    gemm_tiled(A, Bp, bias, C, True)
+
+
+@njit('void(f4[:, ::1], f4[:, :, :, ::1], f4[::1], f4[:, ::1])', cache=True)
+def gemm_bias_tiled(A, Bp, bias, C):
+    """C = A @ B + bias via the tiled GEMM on pre-packed B."""
+    gemm_tiled(A, Bp, bias, C, False)
+
+
+def mlp_forward_tiled(x, W1_packed, b1, W2_packed, b2, hidden_buf, output_buf):
+    """MLP forward pass on the hand-tiled GEMM with fused epilogues."""
+    gemm_relu_bias_tiled(x, W1_packed, b1, hidden_buf)
+    gemm_bias_tiled(hidden_buf, W2_packed, b2, output_buf)
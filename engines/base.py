@@ -19,6 +19,9 @@ class ExecutionEngine(ABC):
         self.weights = weights
         self.config = config
         self.name = "AbstractEngine"
+        # Output of the most recent forward() (engines may return a view into
+        # a reused static buffer, so callers copy it if they need to keep it)
+        self._last_out: Optional[np.ndarray] = None
         
     @abstractmethod
     def forward(self, x: np.ndarray) -> np.ndarray:
@@ -33,6 +36,10 @@ class ExecutionEngine(ABC):
         """
         pass
         
+    def last_output(self) -> Optional[np.ndarray]:
+        """Return the output of the most recent forward() call, or None."""
+        return self._last_out
+        
     def describe(self) -> str:
         """Return a human-readable description of how this engine executes."""
         return f"{self.name}: Base execution engine."
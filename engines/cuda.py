@@ -0,0 +1,110 @@
+import numpy as np
+from .base import ExecutionEngine
+from typing import Dict, Any
+
+# CuPy is optional: without it (or without a GPU) the CPU engines still work,
+# only this engine is unavailable.
+try:
+    import cupy as cp
+    import cupyx
+except ImportError:
+    cp = None
+
+if cp is not None:
+    # In-place epilogues: 'h' is an output parameter, so the kernel reads and
+    # rewrites the device buffer without allocating a temporary.
+    _bias_relu = cp.ElementwiseKernel('T b', 'T h', 'h = max(h + b, (T)0)', 'mlp_bias_relu')
+    _bias_add = cp.ElementwiseKernel('T b', 'T h', 'h = h + b', 'mlp_bias_add')
+
+
+class CudaExecutionEngine(ExecutionEngine):
+    """
+    GPU implementation using CuPy (cuBLAS SGEMM + fused elementwise kernels).
+    Uses:
+    - Weights resident on the device (uploaded once at init)
+    - Pre-allocated device buffers and pinned host staging buffers
+    - A persistent non-blocking stream for copies and kernels
+
+    Same static-planning idea as the Optimized engine, applied to a GPU.
+    """
+
+    def __init__(self, weights: Dict[str, np.ndarray], config: Dict[str, Any]):
+        super().__init__(weights, config)
+        self.name = "CUDA (CuPy)"
+
+        if cp is None:
+            raise RuntimeError("CUDA engine requires CuPy (pip install cupy-cuda12x) and an NVIDIA GPU.")
+
+        max_batch_size = config.get('max_batch_size', 1)
+        input_dim = config.get('input_dim', 1024)
+        hidden_dim = config.get('hidden_dim', 4096)
+        output_dim = config.get('output_dim', 1024)
+
+        self.stream = cp.cuda.Stream(non_blocking=True)
+
+        with self.stream:
+            # Weights live on the device for the lifetime of the engine
+            self.dW1 = cp.asarray(weights['W1'])
+            self.db1 = cp.asarray(weights['b1'])
+            self.dW2 = cp.asarray(weights['W2'])
+            self.db2 = cp.asarray(weights['b2'])
+
+            # Static device buffers
+            self.dx = cp.empty((max_batch_size, input_dim), dtype=cp.float32)
+            self.dh = cp.empty((max_batch_size, hidden_dim), dtype=cp.float32)
+            self.do = cp.empty((max_batch_size, output_dim), dtype=cp.float32)
+        self.stream.synchronize()
+
+        # Pinned host buffers: page-locked, so host<->device copies are true DMA
+        self.x_host = cupyx.empty_pinned((max_batch_size, input_dim), dtype=np.float32)
+        self.out_host = cupyx.empty_pinned((max_batch_size, output_dim), dtype=np.float32)
+
+        # TF32 tensor-core math is faster but only ~1e-3 accurate, so it is opt-in
+        # (analyze.py --tf32, which also loosens the correctness tolerance).
+        if config.get('allow_tf32', False):
+            handle = cp.cuda.device.get_cublas_handle()
+            cp.cuda.cublas.setMathMode(handle, cp.cuda.cublas.CUBLAS_TF32_TENSOR_OP_MATH)
+
+    def forward(self, x: np.ndarray) -> np.ndarray:
+        """
+        Execute forward pass on the GPU and copy the result back to host.
+        """
+        batch_size = x.shape[0]
+
+        # SAFETY: Ensure we don't exceed buffer size
+        if batch_size > self.dx.shape[0]:
+            raise ValueError(f"Batch size {batch_size} exceeds allocated buffer size {self.dx.shape[0]}")
+
+        x_host = self.x_host[:batch_size]
+        out_host = self.out_host[:batch_size]
+        dx = self.dx[:batch_size]
+        dh = self.dh[:batch_size]
+        do = self.do[:batch_size]
+
+        np.copyto(x_host, x)
+        with self.stream:
+            # Host -> Device (async, from pinned memory)
+            dx.set(x_host, stream=self.stream)
+
+            # 1. Linear 1 (cuBLAS) + fused Bias/ReLU
+            cp.dot(dx, self.dW1, out=dh)
+            _bias_relu(self.db1, dh)
+
+            # 2. Linear 2 (cuBLAS) + Bias
+            cp.dot(dh, self.dW2, out=do)
+            _bias_add(self.db2, do)
+
+            # Device -> Host (async, into pinned memory)
+            do.get(stream=self.stream, out=out_host)
+        self.stream.synchronize()
+
+        self._last_out = out_host
+        return out_host
+
+    def describe(self) -> str:
+        return (
+            "CUDA (CuPy) Mode:\n"
+            "  - Weights resident in device memory.\n"
+            "  - Static device buffers + pinned host staging, one persistent stream.\n"
+            "  - cuBLAS SGEMM with fused bias/ReLU elementwise kernels."
+        )
@@ -23,20 +23,25 @@ class NaiveExecutionEngine(ExecutionEngine):
         Execute forward pass using pure NumPy broadcasting and allocation.
         Each operation creates a new array.
         """
+        # Five full-size arrays are allocated per call (3 x (B, hidden), 2 x (B, out)).
+        # The bias broadcast itself is free (b1 is read via a stride-0 view, never
+        # materialized); the cost is that each '+' writes a brand new result array.
+        
         # 1. Linear 1
-        # Allocates new array for dot product results
-        # Allocates another new array for the addition results
+        # Alloc 1: (B, hidden) array for the x @ W1 result
+        # Alloc 2: (B, hidden) array for the '+ b1' result; alloc 1 becomes garbage
         hidden_pre = x @ self.W1 + self.b1
         
         # 2. ReLU
-        # Allocates new array for the Result
+        # Alloc 3: (B, hidden) array for the result (hidden_pre stays alive until return)
         hidden = np.maximum(hidden_pre, 0)
         
         # 3. Linear 2
-        # Allocates new array for dot product
-        # Allocates new array for addition
+        # Alloc 4: (B, out) array for the hidden @ W2 result
+        # Alloc 5: (B, out) array for the '+ b2' result, which is returned
         output = hidden @ self.W2 + self.b2
         
+        self._last_out = output
         return output
 
     def describe(self) -> str:
@@ -0,0 +1,44 @@
+import numpy as np
+from .base import ExecutionEngine
+from typing import Dict, Any
+
+
+class NaiveNjitExecutionEngine(ExecutionEngine):
+    """
+    Intermediate rung between Naive and Optimized.
+    Uses:
+    - Numba-compiled, thread-parallel batch split (prange over samples)
+    - Still a new allocation for every intermediate, no static buffers
+
+    Isolates how much of the Optimized win comes from threading rather
+    than memory planning.
+    """
+
+    def __init__(self, weights: Dict[str, np.ndarray], config: Dict[str, Any]):
+        super().__init__(weights, config)
+        self.name = "Naive (Numba prange)"
+        self.W1 = np.ascontiguousarray(weights['W1'], dtype=np.float32)
+        self.b1 = np.ascontiguousarray(weights['b1'], dtype=np.float32)
+        self.W2 = np.ascontiguousarray(weights['W2'], dtype=np.float32)
+        self.b2 = np.ascontiguousarray(weights['b2'], dtype=np.float32)
+
+        from ._naive_njit_kernels import naive_forward_rows
+        self._forward_rows = naive_forward_rows
+
+    def forward(self, x: np.ndarray) -> np.ndarray:
+        """
+        Execute the per-sample naive forward across threads.
+        """
+        x = np.ascontiguousarray(x, dtype=np.float32)
+        output = self._forward_rows(x, self.W1, self.b1, self.W2, self.b2)
+
+        self._last_out = output
+        return output
+
+    def describe(self) -> str:
+        return (
+            "Naive (Numba prange) Mode:\n"
+            "  - Batch split across threads with numba.prange.\n"
+            "  - Dynamic allocation for every operation (per sample).\n"
+            "  - Temporaries are row-sized, so peak memory is lower than Naive's."
+        )
@@ -3,44 +3,60 @@ import tracemalloc
 import gc
 import numpy as np
 from dataclasses import dataclass, asdict
-from typing import Callable, Any, Dict
+from typing import Callable, Any, Dict, Optional
 
 @dataclass
 class ProfileResult:
-    latency_sec: float
+    latency_sec: float  # median of the per-iteration timings
     peak_memory_kb: float
     output_summary: Dict[str, float]
+    latency_min_sec: float
+    latency_p01_sec: float
+    latency_max_sec: float
 
 class ExecutionProfiler:
     """
     Handles benchmarking of execution engines.
     """
     
-    def __init__(self, warmups: int = 10, iterations: int = 50):
+    def __init__(self, warmups: int = 10, iterations: int = 50, memory_iterations: int = 1):
         self.warmups = warmups
         self.iterations = iterations
+        self.memory_iterations = memory_iterations
         
-    def profile(self, func: Callable, *args) -> ProfileResult:
+    def profile(self, func: Callable, *args, memory_iterations: Optional[int] = None) -> ProfileResult:
         """
         Run the full profile (latency + memory) on a function.
+        memory_iterations overrides the number of traced calls for this run.
         """
         # 1. Warmup
         for _ in range(self.warmups):
             func(*args)
             
         # 2. Measure Latency
-        start_time = time.perf_counter()
-        for _ in range(self.iterations):
+        # Time every call on its own, so outliers (scheduler hiccups, GC) can
+        # be dropped: median is the headline, min ~ the steady-state result.
+        times = np.empty(self.iterations, dtype=np.int64)
+        for i in range(self.iterations):
+            t0 = time.perf_counter_ns()
             last_output = func(*args)
-        end_time = time.perf_counter()
-        avg_latency = (end_time - start_time) / self.iterations
+            times[i] = time.perf_counter_ns() - t0
+        times_sec = times / 1e9
         
         # 3. Measure Memory
+        # The function is already warm here, so no re-warmup under the tracer.
+        # A call's allocation pattern is deterministic (static-buffer and
+        # dynamic engines alike), so one traced call is representative. More
+        # calls over-count: engines keep their previous output alive for
+        # last_output(), so every traced call after the first also counts
+        # the output tensor of the one before it.
+        if memory_iterations is None:
+            memory_iterations = self.memory_iterations
         gc.collect()
         tracemalloc.start()
         try:
-            # Run a few times to trigger allocations
-            for _ in range(self.iterations):
+            tracemalloc.reset_peak()
+            for _ in range(memory_iterations):
                 func(*args)
             _, peak = tracemalloc.get_traced_memory()
         finally:
@@ -57,7 +73,10 @@ class ExecutionProfiler:
         }
         
         return ProfileResult(
-            latency_sec=avg_latency,
+            latency_sec=float(np.median(times_sec)),
             peak_memory_kb=peak_kb,
-            output_summary=output_stats
+            output_summary=output_stats,
+            latency_min_sec=float(times_sec.min()),
+            latency_p01_sec=float(np.percentile(times_sec, 1)),
+            latency_max_sec=float(times_sec.max())
         )
@@ -43,8 +43,9 @@ class OptimizedRunner:
         
         # KEY OPTIMIZATION: Static Buffer Allocation
         # allocate buffers once during init, reuse them every inference
-        self.hidden_buf = np.zeros((max_batch_size, hidden_dim), dtype=np.float32)
-        self.output_buf = np.zeros((max_batch_size, output_dim), dtype=np.float32)
+        # (np.empty: the matmuls overwrite them, so no zero-fill needed)
+        self.hidden_buf = np.empty((max_batch_size, hidden_dim), dtype=np.float32)
+        self.output_buf = np.empty((max_batch_size, output_dim), dtype=np.float32)
         
     def forward(self, x: np.ndarray) -> np.ndarray:
         batch_size = x.shape[0]
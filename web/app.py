@@ -1,74 +1,295 @@
 import sys
 import os
+import asyncio
+import gzip
+import hashlib
+import atexit
 import logging
-import traceback
+import queue
+import time
+import multiprocessing
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict
+from urllib.parse import parse_qs
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
-# Setup basic logging to stdout/stderr
-logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+# Setup logging to stderr (unbuffered), off the request path: the request
+# thread only enqueues the record, a background listener thread writes it.
+class _DeferredQueueHandler(QueueHandler):
+    def prepare(self, record):
+        # Stock QueueHandler formats here (on the caller); leave it to the listener
+        return record
+
+_log_queue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler(sys.stderr)
+_log_stream.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_log_listener = QueueListener(_log_queue, _log_stream)
+logging.basicConfig(level=logging.INFO, handlers=[_DeferredQueueHandler(_log_queue)])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
-# Add parent directory to path so we can import 'analyze', 'engines', etc.
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import uvicorn
+import orjson
+from quart import Quart, Response, request
 
-from flask import Flask, render_template, request
-# Import run_analysis safely
+# Brotli is optional: without it responses are gzip-compressed only
 try:
-    from analyze import run_analysis
-except ImportError as e:
-    logger.error(f"Failed to import run_analysis: {e}")
-    run_analysis = None
+    import brotli
+except ImportError:
+    brotli = None
+# 'web' is a package started from the project root (uvicorn web.app:app or
+# python -m web.app), so 'analyze', 'engines', etc. import directly. A broken
+# import should stop the server from starting, not surface per request.
+from analyze import run_analysis, warm_up
+
+# ASGI app (served by uvicorn): views are coroutines, so one blocking
+# analysis no longer stalls every other client.
+app = Quart(__name__)
+# Input bounds: constant-time checks before any tensor gets allocated
+MAX_BATCH_SIZE = 1024
+MAX_INPUT_CHARS = 4096
+# Only the modes the page offers: the others need optional dependencies
+# (cuda, onnx) or are CLI-only comparisons (naive_njit).
+WEB_MODES = ('baseline', 'optimized', 'both')
+# The form is three short fields; anything bigger is rejected (413) unread.
+# Sized so a maximal input still fits even fully percent-encoded (3 bytes/char).
+app.config['MAX_CONTENT_LENGTH'] = 3 * MAX_INPUT_CHARS + 256
+# Templates are fixed at deploy time: no mtime stat on every render
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+
+# Response compression: the page and the JSON report are small but very
+# repetitive text. Level 4 is cheap on CPU and gets most of the ratio.
+COMPRESS_MIMETYPES = {'text/html', 'application/json'}
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 4
+
+@app.after_request
+async def compress_response(response):
+    if (response.mimetype not in COMPRESS_MIMETYPES
+            or response.status_code != 200
+            or 'Content-Encoding' in response.headers):
+        return response
+    accept = request.accept_encodings
+    if brotli is not None and accept.quality('br') > 0:
+        encoding = 'br'
+    elif accept.quality('gzip') > 0:
+        encoding = 'gzip'
+    else:
+        return response
+    data = await response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    if encoding == 'br':
+        data = brotli.compress(data, quality=COMPRESS_LEVEL)
+    else:
+        data = gzip.compress(data, compresslevel=COMPRESS_LEVEL)
+    response.set_data(data)
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    return response
+
+# The analysis is CPU-bound Python + BLAS, so it runs in a process pool
+# (real parallelism, no GIL contention with the event loop). 'spawn' because
+# forking a process that already runs threads (event loop, BLAS) can deadlock.
+# With several server workers (WEB_CONCURRENCY) the cores are split between
+# their pools rather than each pool claiming all of them.
+# The initializer (analyze.warm_up) must not live in this module: a spawned
+# worker imports the initializer's module to unpickle it, and importing the
+# server (Quart, logging listener, ...) there would be pure overhead.
+MAX_WORKERS = max(1, min(8, os.cpu_count() or 1) // int(os.environ.get('WEB_CONCURRENCY', 1)))
+
+def _new_executor():
+    return ProcessPoolExecutor(
+        max_workers=MAX_WORKERS,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=warm_up,
+    )
+
+# Built in start_pool: anything that merely imports this module (a spawn
+# child re-running 'python -m web.app' as __mp_main__) creates no pool.
+EXECUTOR = None
+ANALYSIS_TIMEOUT_SEC = 60
+
+# Backpressure: at most one running + one queued analysis per worker; beyond
+# that requests get a 503 instead of piling up in the pool's queue.
+ANALYSIS_SLOTS = asyncio.Semaphore(MAX_WORKERS * 2)
+
+def _replace_broken_executor(broken):
+    """
+    A worker died abruptly (OOM kill, segfault): a ProcessPoolExecutor is
+    then unusable for good, so swap in a fresh pool. Every request in flight
+    sees the same break; only the first one replaces it.
+    """
+    global EXECUTOR
+    if EXECUTOR is broken:
+        logger.error("Analysis pool broken, starting a new one")
+        EXECUTOR = _new_executor()
+        broken.shutdown(wait=False)
+
+async def _run_in_pool(*args):
+    """
+    Run one analysis in the process pool and return its result.
+
+    The slot is held until the worker is actually done, not just until the
+    request stops waiting: a worker can't be interrupted, so after a timeout
+    it keeps computing and must still count against the backpressure limit.
+    """
+    await ANALYSIS_SLOTS.acquire()
+    executor = EXECUTOR
+    try:
+        try:
+            future = asyncio.get_running_loop().run_in_executor(executor, run_analysis, *args)
+        except BaseException:
+            ANALYSIS_SLOTS.release()
+            raise
+        future.add_done_callback(lambda _: ANALYSIS_SLOTS.release())
+        # shield: a timeout (or client disconnect) cancels the wait, not the future
+        return await asyncio.wait_for(asyncio.shield(future), timeout=ANALYSIS_TIMEOUT_SEC)
+    except asyncio.TimeoutError:
+        raise RuntimeError(f"Analysis timed out after {ANALYSIS_TIMEOUT_SEC}s")
+    except BrokenProcessPool:
+        _replace_broken_executor(executor)
+        raise RuntimeError("Analysis worker crashed; the pool has been restarted, please retry.")
 
-app = Flask(__name__)
+# Result cache: identical submissions (demo refreshes) are served from memory.
+# functools.lru_cache can't wrap the awaited pool call, so this is the same
+# LRU policy on an OrderedDict; only successful analyses are stored, already
+# serialized, so a hit is returned without re-encoding.
+RESULT_CACHE_SIZE = 256
+_RESULT_CACHE = OrderedDict()
+
+def _cache_key(input_str, batch_size, mode):
+    # Normalize whitespace so '1, 2' and ' 1,  2 ' share an entry
+    return (' '.join(input_str.split()), batch_size, mode)
+
+def _cache_get(key):
+    body = _RESULT_CACHE.get(key)
+    if body is not None:
+        _RESULT_CACHE.move_to_end(key)
+    return body
+
+def _cache_put(key, body):
+    _RESULT_CACHE[key] = body
+    if len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+        _RESULT_CACHE.popitem(last=False)
+
+@app.before_serving
+async def start_pool():
+    global EXECUTOR
+    EXECUTOR = _new_executor()
+    # The pool spawns processes lazily, i.e. on the first real requests.
+    # One trivial task per slot starts (and so warms) every worker before
+    # the server reports startup complete.
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(loop.run_in_executor(EXECUTOR, os.getpid) for _ in range(MAX_WORKERS)))
+
+@app.after_serving
+async def shutdown_pool():
+    # Off the event loop: waits for in-flight analyses, drops queued ones.
+    # (wait=False let the interpreter-exit hook hit an already-closed pipe.)
+    await asyncio.to_thread(EXECUTOR.shutdown, wait=True, cancel_futures=True)
+
+# The page is static (results are rendered client-side from /analyze's JSON),
+# so it is rendered once at startup and every GET / serves the same bytes
+# (with an ETag, so revalidations are a 304).
+_INDEX_HTML = None
+_INDEX_ETAG = None
+
+@app.before_serving
+async def render_index():
+    global _INDEX_HTML, _INDEX_ETAG
+    _INDEX_HTML = await app.jinja_env.get_template('index.html').render_async()
+    _INDEX_ETAG = hashlib.md5(_INDEX_HTML.encode('utf-8')).hexdigest()
 
 @app.route('/', methods=['GET'])
-def index():
-    return render_template('index.html')
+async def index():
+    response = Response(_INDEX_HTML, mimetype='text/html')
+    # Weak: the compressed and identity bodies differ byte-wise, and it must
+    # be set before make_conditional so a 304 carries the same tag as the 200.
+    response.set_etag(_INDEX_ETAG, weak=True)
+    response.cache_control.public = True
+    response.cache_control.max_age = 300
+    return await response.make_conditional(request)
+
+def _json_error(message, status):
+    return Response(orjson.dumps({"error": message}), status=status, mimetype='application/json')
 
 @app.route('/analyze', methods=['POST'])
-def analyze():
-    logger.info("Received /analyze POST request")
+async def analyze():
+    logger.debug("Received /analyze POST request")
     
-    if run_analysis is None:
-        return render_template('index.html', error="Server Configuration Error: Could not import analysis engine.")
-
+    # The body is a tiny urlencoded form: parse it directly instead of going
+    # through the full form parser (MultiDict, file-stream handling).
+    form_body = await request.get_data(cache=False, as_text=True)
     try:
-        input_str = request.form.get('input_str', '')
-        batch_size_str = request.form.get('batch_size', '32')
-        mode = request.form.get('mode', 'both')
+        # keep_blank_values: 'batch_size=' must fail validation like Flask's
+        # form did, not be dropped and silently fall back to the default.
+        form = {key: values[0] for key, values in
+                parse_qs(form_body, keep_blank_values=True, max_num_fields=8).items()}
+        input_str = form.get('input_str', '')
+        batch_size_str = form.get('batch_size', '32').strip()
+        mode = form.get('mode', 'both')
         
-        logger.info(f"Params: Input='{input_str[:20]}...', Batch={batch_size_str}, Mode={mode}")
+        # %-style: nothing is sliced or formatted unless DEBUG is actually enabled
+        logger.debug("Params: Input='%.20s...', Batch=%s, Mode=%s", input_str, batch_size_str, mode)
 
         # Validate input
         if not input_str.strip():
             raise ValueError("Input vector cannot be empty.")
+        if len(input_str) > MAX_INPUT_CHARS:
+            raise ValueError(f"Input vector is too long (max {MAX_INPUT_CHARS} characters).")
             
-        try:
-            batch_size = int(batch_size_str)
-        except ValueError:
+        # Check instead of try/except: no raise-and-catch on the common path
+        if not batch_size_str.isdecimal():
             raise ValueError("Batch size must be an integer.")
+        batch_size = int(batch_size_str)
+        if not 1 <= batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"Batch size must be between 1 and {MAX_BATCH_SIZE}.")
+        if mode not in WEB_MODES:
+            raise ValueError(f"Mode must be one of: {', '.join(WEB_MODES)}.")
 
-        logger.info("Running analysis...")
-        results = run_analysis(input_str, batch_size, mode)
-        logger.info("Analysis complete.")
+        key = _cache_key(input_str, batch_size, mode)
+        body = _cache_get(key)
+        if body is not None:
+            logger.debug("Serving cached analysis.")
+            server_timing = 'cache;desc="hit"'
+        else:
+            if ANALYSIS_SLOTS.locked():
+                logger.warning("Analysis pool saturated, rejecting request")
+                return _json_error("Server busy: too many analyses in progress, please retry shortly.", 503)
 
-        return render_template('index.html', results=results, last_input=input_str, last_batch=batch_size, last_mode=mode)
+            logger.debug("Running analysis...")
+            # The ML work is blocking: hand it to the process pool so the event
+            # loop keeps serving other requests meanwhile.
+            t0 = time.perf_counter()
+            results = await _run_in_pool(key[0], batch_size, mode)
+            # Wall time of the analysis incl. the pool round trip
+            dt_ms = (time.perf_counter() - t0) * 1000
+            logger.debug("Analysis complete.")
+            server_timing = f'analyze;dur={dt_ms:.1f}'
+            body = orjson.dumps(results, option=orjson.OPT_SERIALIZE_NUMPY)
+            _cache_put(key, body)
 
-    except ValueError as ve:
-        logger.warning(f"User Error: {ve}")
-        return render_template('index.html', error=str(ve), last_input=request.form.get('input_str'), last_batch=request.form.get('batch_size'))
-    except Exception as e:
-        logger.error(f"System Error: {e}")
-        traceback.print_exc()
-        return render_template('index.html', error=f"Internal Error: {str(e)}", last_input=request.form.get('input_str'))
+        # JSON only: the page renders the report client-side.
+        # Server-Timing shows up in the browser devtools' timing panel.
+        return Response(body, mimetype='application/json', headers={'Server-Timing': server_timing})
 
-# Catch-all for uncaught exceptions during rendering
-@app.errorhandler(500)
-def handle_500(e):
-    logger.error(f"500 Error: {e}")
-    traceback.print_exc()
-    return f"<h1>Internal Server Error</h1><pre>{str(e)}</pre>", 500
+    except Exception as e:
+        # ValueError is a user error (bad input); anything else is ours
+        if isinstance(e, ValueError):
+            logger.warning("User Error: %s", e)
+            return _json_error(str(e), 400)
+        logger.exception("System Error: %s", e)
+        return _json_error(f"Internal Error: {str(e)}", 500)
 
 if __name__ == '__main__':
+    # Production entry point is the Procfile (uvicorn, or gunicorn with
+    # -k uvicorn.workers.UvicornWorker); this runs the same multi-worker setup.
     port = int(os.environ.get("PORT", 8080))
-    logger.info(f"Starting Flask app on port {port}")
-    app.run(host='0.0.0.0', port=port)
+    # Exported so each worker process sizes its analysis pool to its share
+    workers = int(os.environ.setdefault('WEB_CONCURRENCY', str(os.cpu_count() or 1)))
+    logger.info("Starting ASGI app (uvicorn, %d workers) on port %d", workers, port)
+    uvicorn.run('web.app:app', host='0.0.0.0', port=port, workers=workers)